@@ -18,6 +18,8 @@ class TwitterCrawlCheckpoint(Base):
 
     __tablename__ = "twitter_crawl_checkpoint"
     __table_args__ = {"schema": "crawler"}
+    # Fetch server-generated timestamps via RETURNING instead of a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
     user_id: Mapped[str] = mapped_column(String(255), primary_key=True)
     last_tweet_id: Mapped[str] = mapped_column(String(255))
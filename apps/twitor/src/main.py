@@ -11,6 +11,7 @@ from fastapi.responses import JSONResponse
 from src.api.routes import crawl, health
 from src.core.config import get_settings
 from src.core.database import close_db_connection
+from src.services.bookmark_processor import close_http_client
 
 settings = get_settings()
 
@@ -38,6 +39,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("Shutting down Twitor service...")
     await close_db_connection()
     logger.info("Database connections closed")
+    await close_http_client()
+    logger.info("HTTP client closed")
 
 
 # Create FastAPI application
@@ -1,17 +1,82 @@
 """Simplified bookmark processor for Twitter bookmarks."""
 
-import json
+import asyncio
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, BinaryIO
 
 import httpx
+import orjson
 
 from src.core.config import get_settings
-from src.twitter.client import TwitterBookmark
+from src.twitter.convert import TwitterBookmark
 
 logger = logging.getLogger(__name__)
 
+# twikit media types -> bookmark API media types
+_MEDIA_TYPE_MAP = MappingProxyType({"photo": "IMAGE", "video": "VIDEO", "animated_gif": "VIDEO"})
+
+# Shared HTTP client for the bookmark import API, created on first use
+_http_client: httpx.AsyncClient | None = None
+_http_client_lock = asyncio.Lock()
+
+# (user_id, tweet_id) pairs imported recently, so re-syncs skip the API call. This is an
+# LRU capped at _IMPORTED_POST_IDS_MAX_SIZE entries. The cache can go stale: a bookmark
+# deleted on the server after import is not re-imported until its entry is evicted or
+# the process restarts.
+_IMPORTED_POST_IDS_MAX_SIZE = 50_000
+_imported_post_ids: OrderedDict[tuple[str, str], None] = OrderedDict()
+
+
+def _was_imported(user_id: str, tweet_id: str) -> bool:
+    """Check the import cache, marking a hit as recently used."""
+    key = (user_id, tweet_id)
+    if key not in _imported_post_ids:
+        return False
+    _imported_post_ids.move_to_end(key)
+    return True
+
+
+def _mark_imported(user_id: str, tweet_id: str) -> None:
+    """Record an import, evicting the least recently used entry when full."""
+    _imported_post_ids[(user_id, tweet_id)] = None
+    _imported_post_ids.move_to_end((user_id, tweet_id))
+    if len(_imported_post_ids) > _IMPORTED_POST_IDS_MAX_SIZE:
+        _imported_post_ids.popitem(last=False)
+
+
+async def _get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP/2 client for the bookmark import API."""
+    global _http_client
+
+    if _http_client is None:
+        async with _http_client_lock:
+            if _http_client is None:
+                settings = get_settings()
+                _http_client = httpx.AsyncClient(
+                    base_url=settings.api_base_url,
+                    http2=True,
+                    timeout=httpx.Timeout(10.0, connect=5.0),
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                    headers={
+                        "Authorization": f"Bearer {settings.api_auth_token}",
+                        "Content-Type": "application/json",
+                    },
+                )
+
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client."""
+    global _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class BookmarkProcessorError(Exception):
     """Base exception for bookmark processor errors."""
@@ -28,10 +93,17 @@ class DatabaseImportError(BookmarkProcessorError):
 class ProcessingResult:
     """Result of processing a single bookmark."""
 
-    def __init__(self, success: bool, bookmark_id: str | None = None, error: str | None = None):
+    def __init__(
+        self,
+        success: bool,
+        bookmark_id: str | None = None,
+        error: str | None = None,
+        skipped: bool = False,
+    ):
         self.success = success
         self.bookmark_id = bookmark_id
         self.error = error
+        self.skipped = skipped  # Already imported earlier; no API call was made
 
 
 class BookmarkProcessor:
@@ -49,30 +121,27 @@ class BookmarkProcessor:
         self.export_to_file = export_to_file
         self.session_id = session_id
         self.settings = get_settings()
-        self.accumulated_bookmarks: list[dict[str, Any]] = []
-        self.http_client = None
-
-        if self.save_to_database:
-            self.http_client = httpx.AsyncClient(
-                base_url=self.settings.api_base_url,
-                timeout=30.0,
-                headers={
-                    "Authorization": f"Bearer {self.settings.api_auth_token}",
-                    "Content-Type": "application/json",
-                },
-            )
+        # Exported bookmarks are spooled to a JSON Lines file as they arrive
+        self._export_spool_path: Path | None = None
+        self._export_spool: BinaryIO | None = None
+        self._exported_count = 0
 
     async def process_bookmark(self, bookmark: TwitterBookmark) -> ProcessingResult:
         """Process a single bookmark."""
         try:
             bookmark_data = self._convert_to_dict(bookmark)
-            if self.save_to_database:
+            skipped = False
+            if self.save_to_database and _was_imported(self.user_id, bookmark.tweet_id):
+                skipped = True
+                bookmark_id = None
+            elif self.save_to_database:
                 bookmark_id = await self._import_to_database(bookmark_data)
+                _mark_imported(self.user_id, bookmark.tweet_id)
             else:
                 bookmark_id = bookmark.tweet_id
             if self.export_to_file:
-                self.accumulated_bookmarks.append(bookmark_data)
-            return ProcessingResult(success=True, bookmark_id=bookmark_id)
+                self._spool_for_export(bookmark_data)
+            return ProcessingResult(success=True, bookmark_id=bookmark_id, skipped=skipped)
         except Exception as e:
             logger.error(f"Failed to process bookmark {bookmark.tweet_id}: {e}")
             return ProcessingResult(success=False, error=str(e))
@@ -90,7 +159,11 @@ class BookmarkProcessor:
             "platform": "twitter",
             "userId": self.user_id,
             "media": [
-                {"type": m.media_type, "url": m.url, "thumbnailUrl": m.thumbnail_url}
+                {
+                    "type": _MEDIA_TYPE_MAP.get(m.media_type, "IMAGE"),
+                    "url": m.url,
+                    "thumbnailUrl": m.thumbnail_url,
+                }
                 for m in bookmark.media
             ],
             "metadata": bookmark.metadata,
@@ -98,10 +171,9 @@ class BookmarkProcessor:
 
     async def _import_to_database(self, bookmark_data: dict[str, Any]) -> str:
         """Import bookmark to database via API."""
-        if not self.http_client:
-            raise DatabaseImportError("HTTP client not initialized")
+        http_client = await _get_http_client()
         try:
-            response = await self.http_client.post(
+            response = await http_client.post(
                 "/api/twitter-import/import-bookmark", json=bookmark_data
             )
             response.raise_for_status()
@@ -114,29 +186,59 @@ class BookmarkProcessor:
 
     async def finalize(self) -> str | None:
         """Finalize processing and export to file if enabled."""
-        if self.http_client:
-            await self.http_client.aclose()
-        if self.export_to_file and self.accumulated_bookmarks:
+        if self.export_to_file and self._exported_count:
             return await self._export_to_file()
         return None
 
+    async def close(self) -> None:
+        """Close and remove the export spool if it is still around."""
+        if self._export_spool is not None:
+            self._export_spool.close()
+            self._export_spool = None
+        if self._export_spool_path is not None:
+            self._export_spool_path.unlink(missing_ok=True)
+            self._export_spool_path = None
+
+    def _spool_for_export(self, bookmark_data: dict[str, Any]) -> None:
+        """Append a bookmark to the JSON Lines export spool."""
+        if self._export_spool is None:
+            output_dir = Path(self.settings.output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._export_spool_path = output_dir / f"twitter_bookmarks_{self.session_id}.jsonl"
+            self._export_spool = open(self._export_spool_path, "wb")
+        self._export_spool.write(orjson.dumps(bookmark_data) + b"\n")
+        self._exported_count += 1
+
     async def _export_to_file(self) -> str:
-        """Export accumulated bookmarks to JSON file."""
+        """Export spooled bookmarks to JSON file."""
         output_dir = Path(self.settings.output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
         filename = f"twitter_bookmarks_{self.session_id}.json"
         file_path = output_dir / filename
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(
-                {
-                    "bookmarks": self.accumulated_bookmarks,
-                    "total": len(self.accumulated_bookmarks),
-                    "userId": self.user_id,
-                    "sessionId": self.session_id,
-                },
-                f,
-                indent=2,
-                ensure_ascii=False,
-            )
-        logger.info(f"Exported {len(self.accumulated_bookmarks)} bookmarks to {file_path}")
+        await asyncio.to_thread(self._write_export, file_path)
+        logger.info(f"Exported {self._exported_count} bookmarks to {file_path}")
         return str(file_path)
+
+    def _write_export(self, file_path: Path) -> None:
+        """Stream the JSON Lines spool into the final JSON document, then remove it."""
+        if self._export_spool is None or self._export_spool_path is None:
+            return
+        self._export_spool.close()
+        self._export_spool = None
+
+        with open(self._export_spool_path, "rb") as spool, open(file_path, "wb") as f:
+            f.write(b'{"bookmarks":[')
+            for index, line in enumerate(spool):
+                if index:
+                    f.write(b",")
+                f.write(line.rstrip(b"\n"))
+            f.write(b"],")
+            f.write(
+                orjson.dumps(
+                    {
+                        "total": self._exported_count,
+                        "userId": self.user_id,
+                        "sessionId": self.session_id,
+                    }
+                )[1:]
+            )
+        self._export_spool_path.unlink()
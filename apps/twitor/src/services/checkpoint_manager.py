@@ -68,7 +68,6 @@ class CheckpointManager:
             self.db_session.add(checkpoint)
 
         await self.db_session.commit()
-        await self.db_session.refresh(checkpoint)
         return checkpoint
 
     async def clear_checkpoint(self) -> bool:
@@ -90,8 +89,11 @@ class CheckpointManager:
         Returns:
             Last tweet ID if checkpoint exists, None otherwise
         """
-        checkpoint = await self.get_checkpoint()
-        return checkpoint.last_tweet_id if checkpoint else None
+        stmt = select(TwitterCrawlCheckpoint.last_tweet_id).where(
+            TwitterCrawlCheckpoint.user_id == self.user_id
+        )
+        result = await self.db_session.execute(stmt)
+        return result.scalar_one_or_none()
 
     async def get_bookmarks_count(self) -> int:
         """
@@ -100,5 +102,8 @@ class CheckpointManager:
         Returns:
             Total bookmarks count, 0 if no checkpoint exists
         """
-        checkpoint = await self.get_checkpoint()
-        return checkpoint.bookmarks_count if checkpoint else 0
+        stmt = select(TwitterCrawlCheckpoint.bookmarks_count).where(
+            TwitterCrawlCheckpoint.user_id == self.user_id
+        )
+        result = await self.db_session.execute(stmt)
+        return result.scalar_one_or_none() or 0
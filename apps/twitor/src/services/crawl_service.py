@@ -1,6 +1,7 @@
 """Crawl orchestration service for managing Twitter bookmark crawling sessions."""
 
 import asyncio
+import contextlib
 import logging
 import uuid
 from datetime import datetime
@@ -285,50 +286,83 @@ class CrawlService:
             # Fetch and process bookmarks
             bookmarks_processed = 0
 
-            async for bookmark in twitter_client.get_bookmarks(
+            bookmarks = twitter_client.get_bookmarks(
                 since_id=since_id,
                 max_results=self.settings.batch_size,
-            ):
-                retry_count = 0
-                processing_success = False
-
-                # Retry loop for processing individual bookmarks
-                while retry_count <= error_handler.max_retries and not processing_success:
-                    try:
-                        # Process bookmark
-                        result = await bookmark_processor.process_bookmark(bookmark)
-
-                        if result.success:
-                            bookmarks_processed += 1
-                            last_tweet_id = bookmark.tweet_id
-                            processing_success = True
-
-                            # Update checkpoint periodically (every 10 bookmarks)
-                            if bookmarks_processed % 10 == 0:
-                                await checkpoint_manager.save_checkpoint(
-                                    tweet_id=last_tweet_id,
-                                    bookmarks_count=bookmarks_processed,
+            )
+            # aclosing() finalizes the generator as soon as the loop exits, so its
+            # page prefetch is cancelled instead of running on until garbage collection
+            async with contextlib.aclosing(bookmarks):
+                async for bookmark in bookmarks:
+                    retry_count = 0
+                    processing_success = False
+
+                    # Retry loop for processing individual bookmarks
+                    while retry_count <= error_handler.max_retries and not processing_success:
+                        try:
+                            # Process bookmark
+                            result = await bookmark_processor.process_bookmark(bookmark)
+
+                            if result.success:
+                                bookmarks_processed += 1
+                                last_tweet_id = bookmark.tweet_id
+                                processing_success = True
+
+                                # Update checkpoint periodically (every 10 bookmarks)
+                                if bookmarks_processed % 10 == 0:
+                                    await checkpoint_manager.save_checkpoint(
+                                        tweet_id=last_tweet_id,
+                                        bookmarks_count=bookmarks_processed,
+                                    )
+
+                                # Send progress update with summarization status
+                                await streamer.send_progress(
+                                    bookmarks_processed=bookmarks_processed,
+                                    current_bookmark={
+                                        "tweetId": bookmark.tweet_id,
+                                        "text": bookmark.text[:100],  # Truncate for progress
+                                        "author": bookmark.author_username,
+                                    },
+                                    summarization_status=result.summarization_status,
                                 )
 
-                            # Send progress update with summarization status
-                            await streamer.send_progress(
-                                bookmarks_processed=bookmarks_processed,
-                                current_bookmark={
-                                    "tweetId": bookmark.tweet_id,
-                                    "text": bookmark.text[:100],  # Truncate for progress
-                                    "author": bookmark.author_username,
-                                },
-                                summarization_status=result.summarization_status,
-                            )
+                                logger.debug(
+                                    f"Processed bookmark {bookmarks_processed}: "
+                                    f"{bookmark.tweet_id} "
+                                    f"(summarization: {result.summarization_status})"
+                                )
+                            else:
+                                # Processing failed - handle error
+                                error_context = ErrorContext(
+                                    error=DatabaseError(result.error or "Unknown error"),
+                                    retry_count=retry_count,
+                                    last_processed_id=last_tweet_id,
+                                    session_id=session_id,
+                                    user_id=user_id,
+                                    operation="process_bookmark",
+                                )
 
-                            logger.debug(
-                                f"Processed bookmark {bookmarks_processed}: {bookmark.tweet_id} "
-                                f"(summarization: {result.summarization_status})"
-                            )
-                        else:
-                            # Processing failed - handle error
+                                strategy = await error_handler.handle_error(error_context)
+
+                                if strategy.action == ErrorAction.SKIP:
+                                    # Skip this bookmark and continue
+                                    logger.warning(
+                                        f"Skipping bookmark {bookmark.tweet_id}: {result.error}"
+                                    )
+                                    processing_success = True  # Mark as "handled"
+                                    break
+                                elif strategy.action == ErrorAction.RETRY:
+                                    # Retry processing
+                                    retry_count += 1
+                                    await asyncio.sleep(strategy.delay)
+                                else:
+                                    # Abort or other action
+                                    raise DatabaseError(result.error or "Processing failed")
+
+                        except DatabaseError as e:
+                            # Handle database errors with error handler
                             error_context = ErrorContext(
-                                error=DatabaseError(result.error or "Unknown error"),
+                                error=e,
                                 retry_count=retry_count,
                                 last_processed_id=last_tweet_id,
                                 session_id=session_id,
@@ -339,71 +373,43 @@ class CrawlService:
                             strategy = await error_handler.handle_error(error_context)
 
                             if strategy.action == ErrorAction.SKIP:
-                                # Skip this bookmark and continue
                                 logger.warning(
-                                    f"Skipping bookmark {bookmark.tweet_id}: {result.error}"
+                                    f"Skipping bookmark {bookmark.tweet_id} after error: {e}"
                                 )
-                                processing_success = True  # Mark as "handled"
+                                processing_success = True  # Mark as handled
                                 break
                             elif strategy.action == ErrorAction.RETRY:
-                                # Retry processing
                                 retry_count += 1
                                 await asyncio.sleep(strategy.delay)
                             else:
-                                # Abort or other action
-                                raise DatabaseError(result.error or "Processing failed")
-
-                    except DatabaseError as e:
-                        # Handle database errors with error handler
-                        error_context = ErrorContext(
-                            error=e,
-                            retry_count=retry_count,
-                            last_processed_id=last_tweet_id,
-                            session_id=session_id,
-                            user_id=user_id,
-                            operation="process_bookmark",
-                        )
-
-                        strategy = await error_handler.handle_error(error_context)
-
-                        if strategy.action == ErrorAction.SKIP:
-                            logger.warning(
-                                f"Skipping bookmark {bookmark.tweet_id} after error: {e}"
+                                # Fatal error - re-raise
+                                raise
+
+                        except Exception as e:
+                            # Unexpected error during processing
+                            logger.error(
+                                f"Unexpected error processing bookmark {bookmark.tweet_id}: {e}"
                             )
-                            processing_success = True  # Mark as handled
-                            break
-                        elif strategy.action == ErrorAction.RETRY:
-                            retry_count += 1
-                            await asyncio.sleep(strategy.delay)
-                        else:
-                            # Fatal error - re-raise
-                            raise
-
-                    except Exception as e:
-                        # Unexpected error during processing
-                        logger.error(
-                            f"Unexpected error processing bookmark {bookmark.tweet_id}: {e}"
-                        )
-                        error_context = ErrorContext(
-                            error=e,
-                            retry_count=retry_count,
-                            last_processed_id=last_tweet_id,
-                            session_id=session_id,
-                            user_id=user_id,
-                            operation="process_bookmark",
-                        )
-
-                        strategy = await error_handler.handle_error(error_context)
-
-                        if strategy.action == ErrorAction.SKIP:
-                            processing_success = True
-                            break
-                        elif strategy.action == ErrorAction.ABORT:
-                            raise
-                        else:
-                            retry_count += 1
-                            if strategy.delay > 0:
-                                await asyncio.sleep(strategy.delay)
+                            error_context = ErrorContext(
+                                error=e,
+                                retry_count=retry_count,
+                                last_processed_id=last_tweet_id,
+                                session_id=session_id,
+                                user_id=user_id,
+                                operation="process_bookmark",
+                            )
+
+                            strategy = await error_handler.handle_error(error_context)
+
+                            if strategy.action == ErrorAction.SKIP:
+                                processing_success = True
+                                break
+                            elif strategy.action == ErrorAction.ABORT:
+                                raise
+                            else:
+                                retry_count += 1
+                                if strategy.delay > 0:
+                                    await asyncio.sleep(strategy.delay)
 
             # Save final checkpoint
             if last_tweet_id:
@@ -507,6 +513,8 @@ class CrawlService:
             # Cleanup
             if bookmark_processor:
                 await bookmark_processor.close()
+            if twitter_client:
+                await twitter_client.disconnect()
 
             await remove_streamer(session_id)
             logger.info(f"Cleanup completed for session {session_id}")
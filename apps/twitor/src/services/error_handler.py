@@ -32,7 +32,7 @@ class ErrorAction(str, Enum):
     PAUSE = "pause"  # Pause and wait before continuing
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorContext:
     """Context information about an error."""
 
@@ -42,9 +42,10 @@ class ErrorContext:
     session_id: str | None = None
     user_id: str | None = None
     operation: str | None = None
+    category: ErrorCategory | None = None  # Cached result of classify_error
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorRecoveryStrategy:
     """Strategy for recovering from an error."""
 
@@ -92,6 +93,15 @@ class ErrorHandler:
         self.checkpoint_manager = checkpoint_manager
         self.max_retries = max_retries
         self.initial_backoff = initial_backoff
+        self._dispatch = {
+            ErrorCategory.AUTH: self._handle_auth_error,
+            ErrorCategory.RATE_LIMIT: self._handle_rate_limit_error,
+            ErrorCategory.NETWORK: self._handle_network_error,
+            ErrorCategory.VALIDATION: self._handle_validation_error,
+            ErrorCategory.DATABASE: self._handle_database_error,
+            ErrorCategory.FATAL: self._handle_fatal_error,
+        }
+        self._pending_checkpoints: dict[str, asyncio.Task[None]] = {}
 
     def classify_error(self, error: Exception) -> ErrorCategory:
         """
@@ -149,7 +159,9 @@ class ErrorHandler:
         Returns:
             ErrorRecoveryStrategy with action to take
         """
-        category = self.classify_error(context.error)
+        if context.category is None:
+            context.category = self.classify_error(context.error)
+        category = context.category
         error_msg = str(context.error)
 
         logger.info(
@@ -158,23 +170,9 @@ class ErrorHandler:
         )
 
         # Handle based on category
-        if category == ErrorCategory.AUTH:
-            return await self._handle_auth_error(context)
-
-        elif category == ErrorCategory.RATE_LIMIT:
-            return await self._handle_rate_limit_error(context)
-
-        elif category == ErrorCategory.NETWORK:
-            return await self._handle_network_error(context)
-
-        elif category == ErrorCategory.VALIDATION:
-            return await self._handle_validation_error(context)
-
-        elif category == ErrorCategory.DATABASE:
-            return await self._handle_database_error(context)
-
-        elif category == ErrorCategory.FATAL:
-            return await self._handle_fatal_error(context)
+        handler = self._dispatch.get(category)
+        if handler:
+            return await handler(context)
 
         # Default: abort
         return ErrorRecoveryStrategy(
@@ -331,13 +329,11 @@ class ErrorHandler:
 
         # Save checkpoint if available
         if self.checkpoint_manager and context.last_processed_id:
-            try:
-                await self.checkpoint_manager.save_checkpoint(
-                    tweet_id=context.last_processed_id,
+            await asyncio.shield(
+                self._schedule_checkpoint_save(
+                    context.last_processed_id, label="checkpoint on fatal error"
                 )
-                logger.info(f"Checkpoint saved: {context.last_processed_id}")
-            except Exception as e:
-                logger.error(f"Failed to save checkpoint on fatal error: {e}")
+            )
 
         return ErrorRecoveryStrategy(
             action=ErrorAction.ABORT,
@@ -357,25 +353,79 @@ class ErrorHandler:
             strategy: The recovery strategy to execute
             context: Error context
         """
-        # Apply delay if specified
-        if strategy.delay > 0:
-            logger.info(f"Waiting {strategy.delay:.1f} seconds before {strategy.action.value}...")
-            await asyncio.sleep(strategy.delay)
-
-        # Save checkpoint if required
-        if strategy.should_save_checkpoint and self.checkpoint_manager:
-            if context.last_processed_id:
-                try:
-                    await self.checkpoint_manager.save_checkpoint(
-                        tweet_id=context.last_processed_id,
-                    )
-                    logger.info(f"Checkpoint saved: {context.last_processed_id}")
-                except Exception as e:
-                    logger.error(f"Failed to save checkpoint: {e}")
+        # Save checkpoint if required, concurrently with the delay below
+        checkpoint_task: asyncio.Task[None] | None = None
+        if (
+            strategy.should_save_checkpoint
+            and self.checkpoint_manager
+            and context.last_processed_id
+        ):
+            checkpoint_task = self._schedule_checkpoint_save(context.last_processed_id)
+
+        try:
+            # Apply delay if specified
+            if strategy.delay > 0:
+                logger.info(
+                    f"Waiting {strategy.delay:.1f} seconds before {strategy.action.value}..."
+                )
+                await asyncio.sleep(strategy.delay)
+        finally:
+            if checkpoint_task:
+                await asyncio.shield(checkpoint_task)
 
         # Log the action
         logger.info(f"Recovery action: {strategy.action.value} - {strategy.message}")
 
+    def _schedule_checkpoint_save(
+        self, tweet_id: str, label: str = "checkpoint"
+    ) -> asyncio.Task[None]:
+        """
+        Start a checkpoint save, reusing an in-flight save for the same tweet ID.
+
+        Callers should await the task through asyncio.shield so that cancelling
+        one of them doesn't abort a save the others are waiting on.
+
+        Args:
+            tweet_id: The tweet ID to save as checkpoint
+            label: Name of the checkpoint in log messages (an in-flight save
+                keeps the label it was started with)
+
+        Returns:
+            Task completing when the checkpoint has been written
+        """
+        task = self._pending_checkpoints.get(tweet_id)
+        if task and not task.done():
+            return task
+
+        task = asyncio.create_task(self._save_checkpoint(tweet_id, label))
+        self._pending_checkpoints[tweet_id] = task
+        task.add_done_callback(
+            lambda t: (
+                self._pending_checkpoints.pop(tweet_id, None)
+                if self._pending_checkpoints.get(tweet_id) is t
+                else None
+            )
+        )
+        return task
+
+    async def _save_checkpoint(self, tweet_id: str, label: str = "checkpoint") -> None:
+        """
+        Save a checkpoint, logging instead of raising on failure.
+
+        Args:
+            tweet_id: The tweet ID to save as checkpoint
+            label: Name of the checkpoint in log messages
+        """
+        checkpoint_manager = self.checkpoint_manager
+        if checkpoint_manager is None:
+            return
+
+        try:
+            await checkpoint_manager.save_checkpoint(tweet_id=tweet_id)
+            logger.info(f"{label.capitalize()} saved: {tweet_id}")
+        except Exception as e:
+            logger.error(f"Failed to save {label}: {e}")
+
     def calculate_backoff(self, retry_count: int) -> float:
         """
         Calculate exponential backoff time.
@@ -398,7 +448,7 @@ class ErrorHandler:
         Returns:
             True if should retry, False otherwise
         """
-        category = self.classify_error(context.error)
+        category = context.category or self.classify_error(context.error)
 
         # Never retry auth or validation errors
         if category in (ErrorCategory.AUTH, ErrorCategory.VALIDATION):
@@ -427,26 +477,29 @@ class ErrorHandler:
 
         # Save checkpoint
         if self.checkpoint_manager and context.last_processed_id:
-            try:
-                await self.checkpoint_manager.save_checkpoint(
-                    tweet_id=context.last_processed_id,
-                )
-                logger.info(f"Final checkpoint saved: {context.last_processed_id}")
-            except Exception as e:
-                logger.error(f"Failed to save final checkpoint: {e}")
+            await asyncio.shield(
+                self._schedule_checkpoint_save(context.last_processed_id, label="final checkpoint")
+            )
 
         # Execute cleanup tasks
         if cleanup_tasks:
             logger.info(f"Executing {len(cleanup_tasks)} cleanup tasks...")
+            awaitables = []
             for task in cleanup_tasks:
                 try:
                     if asyncio.iscoroutine(task):
-                        await task
+                        awaitables.append(task)
                     elif callable(task):
                         result = task()
                         if asyncio.iscoroutine(result):
-                            await result
+                            awaitables.append(result)
                 except Exception as e:
                     logger.error(f"Error during cleanup: {e}")
 
+            # Run independent cleanups concurrently; one failure doesn't block the rest
+            results = await asyncio.gather(*awaitables, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error during cleanup: {result}")
+
         logger.info("Graceful shutdown complete")
@@ -1,12 +1,14 @@
 """Queue manager using Valkey (Redis-compatible) for distributed task processing."""
 
 import asyncio
-import json
+import hashlib
 import logging
+import time
 from dataclasses import asdict, dataclass
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 
+import orjson
 import redis.asyncio as redis
 
 from src.core.config import get_settings
@@ -14,7 +16,7 @@ from src.core.config import get_settings
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueTask:
     """Represents a task in the queue."""
 
@@ -27,6 +29,19 @@ class QueueTask:
     priority: int = 0  # Higher priority = processed first
 
 
+def _task_from_dict(data: dict[str, Any]) -> QueueTask:
+    """Build a QueueTask from its serialized form using positional arguments."""
+    return QueueTask(
+        data["task_id"],
+        data["task_type"],
+        data["payload"],
+        data["created_at"],
+        data.get("retry_count", 0),
+        data.get("max_retries", 3),
+        data.get("priority", 0),
+    )
+
+
 class QueueManager:
     """Manages task queues using Valkey (Redis)."""
 
@@ -35,6 +50,7 @@ class QueueManager:
         redis_url: str | None = None,
         queue_name: str = "twitor:tasks",
         max_queue_size: int = 10000,
+        dedup_ttl: int = 3600,
     ):
         """
         Initialize queue manager.
@@ -43,13 +59,19 @@ class QueueManager:
             redis_url: Redis/Valkey connection URL
             queue_name: Name of the queue
             max_queue_size: Maximum number of items in queue
+            dedup_ttl: Seconds an idempotency key is remembered after enqueue
         """
         settings = get_settings()
         self.redis_url = redis_url or settings.valkey_url
         self.queue_name = queue_name
         self.max_queue_size = max_queue_size
+        self.dedup_ttl = dedup_ttl
         self.redis_client: redis.Redis | None = None
         self._connected = False
+        # Approximate length of the regular queue, reconciled from RPUSH replies.
+        # LLEN is only issued once the estimate nears max_queue_size.
+        self._approx_size = 0
+        self._size_check_threshold = int(max_queue_size * 0.9)
 
     async def connect(self) -> None:
         """Connect to Valkey/Redis."""
@@ -59,14 +81,14 @@ class QueueManager:
         try:
             self.redis_client = redis.from_url(
                 self.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
+                decode_responses=False,  # orjson consumes raw bytes directly
                 socket_connect_timeout=5,
                 socket_keepalive=True,
             )
 
             # Test connection
             await self.redis_client.ping()
+            self._approx_size = await self.redis_client.llen(self.queue_name)
             self._connected = True
             logger.info(f"Connected to Valkey at {self.redis_url}")
 
@@ -87,6 +109,7 @@ class QueueManager:
         payload: dict[str, Any],
         task_id: str | None = None,
         priority: int = 0,
+        idempotent: bool = False,
     ) -> str:
         """
         Add a task to the queue.
@@ -96,6 +119,8 @@ class QueueManager:
             payload: Task payload data
             task_id: Optional task ID (generated if not provided)
             priority: Task priority (higher = processed first)
+            idempotent: Derive the task ID from the payload and skip the push if the
+                same task was already enqueued within dedup_ttl
 
         Returns:
             Task ID
@@ -106,39 +131,61 @@ class QueueManager:
         if not self._connected or not self.redis_client:
             await self.connect()
 
-        # Check queue size
-        queue_size = await self.redis_client.llen(self.queue_name)
-        if queue_size >= self.max_queue_size:
-            raise Exception(f"Queue is full (max size: {self.max_queue_size})")
+        # Check queue size (only round-trips to Valkey when close to the limit)
+        if self._approx_size >= self._size_check_threshold:
+            self._approx_size = await self.redis_client.llen(self.queue_name)
+            if self._approx_size >= self.max_queue_size:
+                raise Exception(f"Queue is full (max size: {self.max_queue_size})")
 
         # Generate task ID if not provided
         if not task_id:
-            task_id = f"{task_type}:{datetime.utcnow().timestamp()}"
+            if idempotent:
+                digest = hashlib.blake2b(
+                    orjson.dumps(payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS),
+                    digest_size=16,
+                ).hexdigest()
+                task_id = f"{task_type}:{digest}"
+            else:
+                task_id = f"{task_type}:{time.time_ns()}"
+
+        # Skip duplicates of an idempotent task enqueued within dedup_ttl
+        dedup_key = None
+        if idempotent:
+            dedup_key = f"{self.queue_name}:dedup:{task_id}"
+            if not await self.redis_client.set(dedup_key, 1, nx=True, ex=self.dedup_ttl):
+                logger.debug(f"Skipped duplicate task {task_id} (type: {task_type})")
+                return task_id
 
         # Create task
         task = QueueTask(
             task_id=task_id,
             task_type=task_type,
             payload=payload,
-            created_at=datetime.utcnow().isoformat(),
+            created_at=datetime.now(UTC).isoformat(),
             priority=priority,
         )
 
         # Serialize task
-        task_json = json.dumps(asdict(task))
+        task_json = orjson.dumps(asdict(task), option=orjson.OPT_NON_STR_KEYS)
 
         # Add to queue (right push for FIFO)
         # For priority, we use sorted sets
-        if priority > 0:
-            # Use sorted set for priority queue
-            priority_queue = f"{self.queue_name}:priority"
-            await self.redis_client.zadd(
-                priority_queue,
-                {task_json: -priority},  # Negative for descending order
-            )
-        else:
-            # Use list for regular FIFO queue
-            await self.redis_client.rpush(self.queue_name, task_json)
+        try:
+            if priority > 0:
+                # Use sorted set for priority queue
+                priority_queue = f"{self.queue_name}:priority"
+                await self.redis_client.zadd(
+                    priority_queue,
+                    {task_json: -priority},  # Negative for descending order
+                )
+            else:
+                # Use list for regular FIFO queue (RPUSH returns the new length)
+                self._approx_size = await self.redis_client.rpush(self.queue_name, task_json)
+        except Exception:
+            # Release the idempotency key so a retry of this task isn't skipped
+            if dedup_key:
+                await self.redis_client.delete(dedup_key)
+            raise
 
         logger.debug(f"Enqueued task {task_id} (type: {task_type}, priority: {priority})")
         return task_id
@@ -162,8 +209,8 @@ class QueueManager:
 
         if priority_task:
             task_json = priority_task[0][0]  # (value, score) tuple
-            task_data = json.loads(task_json)
-            return QueueTask(**task_data)
+            task_data = orjson.loads(task_json)
+            return _task_from_dict(task_data)
 
         # Check regular queue
         if timeout > 0:
@@ -171,14 +218,16 @@ class QueueManager:
             result = await self.redis_client.blpop(self.queue_name, timeout=timeout)
             if result:
                 _, task_json = result
-                task_data = json.loads(task_json)
-                return QueueTask(**task_data)
+                self._approx_size = max(0, self._approx_size - 1)
+                task_data = orjson.loads(task_json)
+                return _task_from_dict(task_data)
         else:
             # Non-blocking pop
             task_json = await self.redis_client.lpop(self.queue_name)
             if task_json:
-                task_data = json.loads(task_json)
-                return QueueTask(**task_data)
+                self._approx_size = max(0, self._approx_size - 1)
+                task_data = orjson.loads(task_json)
+                return _task_from_dict(task_data)
 
         return None
 
@@ -203,14 +252,14 @@ class QueueManager:
 
         if priority_tasks:
             task_json = priority_tasks[0]
-            task_data = json.loads(task_json)
-            return QueueTask(**task_data)
+            task_data = orjson.loads(task_json)
+            return _task_from_dict(task_data)
 
         # Check regular queue
         task_json = await self.redis_client.lindex(self.queue_name, 0)
         if task_json:
-            task_data = json.loads(task_json)
-            return QueueTask(**task_data)
+            task_data = orjson.loads(task_json)
+            return _task_from_dict(task_data)
 
         return None
 
@@ -225,6 +274,7 @@ class QueueManager:
             await self.connect()
 
         regular_size = await self.redis_client.llen(self.queue_name)
+        self._approx_size = regular_size
         priority_queue = f"{self.queue_name}:priority"
         priority_size = await self.redis_client.zcard(priority_queue)
 
@@ -246,6 +296,7 @@ class QueueManager:
 
         await self.redis_client.delete(self.queue_name)
         await self.redis_client.delete(priority_queue)
+        self._approx_size = 0
 
         total_removed = regular_size + priority_size
         logger.info(f"Cleared {total_removed} tasks from queue")
@@ -296,7 +347,7 @@ class QueueManager:
             await self.connect()
 
         dead_letter_queue = f"{self.queue_name}:dead_letter"
-        task_json = json.dumps(asdict(task))
+        task_json = orjson.dumps(asdict(task), option=orjson.OPT_NON_STR_KEYS)
 
         await self.redis_client.rpush(dead_letter_queue, task_json)
         logger.info(f"Moved task {task.task_id} to dead letter queue")
@@ -317,12 +368,7 @@ class QueueManager:
         dead_letter_queue = f"{self.queue_name}:dead_letter"
         task_jsons = await self.redis_client.lrange(dead_letter_queue, 0, limit - 1)
 
-        tasks = []
-        for task_json in task_jsons:
-            task_data = json.loads(task_json)
-            tasks.append(QueueTask(**task_data))
-
-        return tasks
+        return [_task_from_dict(orjson.loads(task_json)) for task_json in task_jsons]
 
     async def health_check(self) -> dict[str, Any]:
         """
@@ -1,47 +1,31 @@
 """Twitter client module for fetching bookmarks using twikit."""
 
 import asyncio
+import functools
+import inspect
 import logging
-from collections.abc import AsyncIterator
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Any
-
-from twikit import Client
-from twikit.errors import (
-    BadRequest,
-    Forbidden,
-    NotFound,
-    ServerError,
-    TooManyRequests,
-    Unauthorized,
-)
+import random
+from collections.abc import AsyncGenerator
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from twikit import Client
 
+from src.twitter.convert import TwitterBookmark, convert_tweet_to_bookmark
 
-@dataclass
-class TwitterMedia:
-    """Represents media attached to a tweet."""
+logger = logging.getLogger(__name__)
 
-    media_type: str  # 'photo', 'video', 'animated_gif'
-    url: str
-    thumbnail_url: str | None = None
+# Upper bound for a single retry delay
+_MAX_BACKOFF_SECONDS = 60.0
 
 
-@dataclass
-class TwitterBookmark:
-    """Represents a Twitter bookmark."""
+@functools.lru_cache(maxsize=1)
+def _twikit_errors() -> ModuleType:
+    """Import twikit's error module on first use, keeping twikit off the import path."""
+    import twikit.errors
 
-    tweet_id: str
-    tweet_url: str
-    text: str
-    author_name: str
-    author_username: str
-    author_profile_url: str
-    created_at: datetime
-    media: list[TwitterMedia]
-    metadata: dict[str, Any]
+    return twikit.errors
 
 
 class TwitterClientError(Exception):
@@ -71,6 +55,12 @@ class NetworkError(TwitterClientError):
     pass
 
 
+class NotConnectedError(TwitterClientError):
+    """Raised when the client is used before connect() has been called."""
+
+    pass
+
+
 class TwitterClient:
     """Client for interacting with Twitter API via twikit."""
 
@@ -90,7 +80,7 @@ class TwitterClient:
             password: Twitter password
             email: Twitter email
             max_retries: Maximum number of retry attempts for network errors
-            initial_backoff: Initial backoff time in seconds for exponential backoff
+            initial_backoff: Minimum backoff time in seconds between retries
         """
         self.username = username
         self.password = password
@@ -99,6 +89,63 @@ class TwitterClient:
         self.initial_backoff = initial_backoff
         self.client: Client | None = None
         self._authenticated = False
+        self._author_url_cache: dict[str, str] = {}
+
+    async def connect(self) -> "Client":
+        """
+        Create the underlying twikit client and its pooled HTTP session.
+
+        The session is kept for the lifetime of this object so every request
+        reuses open TCP/TLS connections to Twitter.
+
+        Returns:
+            The connected twikit client
+        """
+        if self.client:
+            return self.client
+
+        import httpx
+        from twikit import Client
+
+        self.client = Client(
+            "en-US",
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=75.0,
+            ),
+        )
+        return self.client
+
+    async def disconnect(self) -> None:
+        """Close the underlying HTTP session."""
+        if self.client:
+            await self.client.http.aclose()
+            self.client = None
+            self._authenticated = False
+
+    async def __aenter__(self) -> "TwitterClient":
+        """Context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        await self.disconnect()
+
+    def _require_client(self) -> "Client":
+        """
+        Return the connected, authenticated twikit client.
+
+        Raises:
+            NotConnectedError: If connect() has not been called
+            AuthenticationError: If not authenticated
+        """
+        if not self.client:
+            raise NotConnectedError("Client not connected. Call connect() first.")
+        if not self._authenticated:
+            raise AuthenticationError("Client not authenticated. Call authenticate() first.")
+        return self.client
 
     async def authenticate(self) -> bool:
         """
@@ -113,13 +160,16 @@ class TwitterClient:
         if self._authenticated and self.client:
             return True
 
+        # Reuse the pooled session if one is already open
+        client = await self.connect()
+        errors = _twikit_errors()
+
         try:
             logger.info(f"Authenticating with Twitter as {self.username}")
-            self.client = Client("en-US")
 
             # Attempt login with retry logic for network errors
             await self._retry_with_backoff(
-                self.client.login,
+                client.login,
                 auth_info_1=self.username,
                 auth_info_2=self.email,
                 password=self.password,
@@ -129,7 +179,7 @@ class TwitterClient:
             logger.info("Successfully authenticated with Twitter")
             return True
 
-        except (Unauthorized, Forbidden) as e:
+        except (errors.Unauthorized, errors.Forbidden) as e:
             error_msg = f"Authentication failed: Invalid credentials - {str(e)}"
             logger.error(error_msg)
             raise AuthenticationError(error_msg) from e
@@ -142,7 +192,7 @@ class TwitterClient:
         self,
         since_id: str | None = None,
         max_results: int = 100,
-    ) -> AsyncIterator[TwitterBookmark]:
+    ) -> AsyncGenerator[TwitterBookmark, None]:
         """
         Fetch bookmarks with pagination.
 
@@ -154,24 +204,102 @@ class TwitterClient:
             TwitterBookmark objects
 
         Raises:
+            NotConnectedError: If not connected
             AuthenticationError: If not authenticated
             RateLimitError: If rate limit is exceeded
             NetworkError: If network errors occur after retries
         """
-        if not self._authenticated or not self.client:
-            raise AuthenticationError("Client not authenticated. Call authenticate() first.")
+        client = self._require_client()
 
         logger.info(f"Fetching bookmarks (since_id={since_id}, max_results={max_results})")
 
+        producer: asyncio.Task[None] | None = None
+
         try:
-            cursor = None
+            # Tweet IDs are numeric snowflakes; compare them as integers, not strings
+            since_id_int = int(since_id) if since_id else None
+
+            # Pages are fetched by a background task while the current one is being
+            # converted and yielded. With two pages queued and one request in flight, it
+            # runs up to three pages ahead; callers should close the generator (e.g.
+            # with contextlib.aclosing) when they stop iterating early, so it stops too.
+            pages: asyncio.Queue[list[Any] | Exception | None] = asyncio.Queue(maxsize=2)
+            producer = asyncio.create_task(
+                self._prefetch_bookmark_pages(client, max_results, pages, since_id_int)
+            )
+
             total_fetched = 0
 
+            while True:
+                tweets = await pages.get()
+                if tweets is None:
+                    break
+                if isinstance(tweets, Exception):
+                    raise tweets
+
+                # Stop at the since_id checkpoint
+                reached_checkpoint = False
+                if since_id_int is not None:
+                    for index, tweet in enumerate(tweets):
+                        if int(tweet.id) <= since_id_int:
+                            tweets = tweets[:index]
+                            reached_checkpoint = True
+                            break
+
+                # Convert the page to TwitterBookmarks
+                for bookmark in await self.convert_batch(tweets):
+                    total_fetched += 1
+                    yield bookmark
+
+                if reached_checkpoint:
+                    logger.info(f"Reached checkpoint tweet {since_id}, stopping")
+                    return
+
+                logger.info(f"Fetched {total_fetched} bookmarks so far")
+
+            logger.info(f"Completed fetching bookmarks. Total: {total_fetched}")
+
+        except RateLimitError:
+            raise
+        except AuthenticationError:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error during bookmark fetching: {e}")
+            raise NetworkError(f"Bookmark fetching failed: {str(e)}") from e
+        finally:
+            if producer:
+                producer.cancel()
+                # Let the cancelled task unwind; wait() doesn't re-raise its CancelledError
+                await asyncio.wait({producer})
+            self._author_url_cache.clear()
+
+    async def _prefetch_bookmark_pages(
+        self,
+        client: "Client",
+        max_results: int,
+        pages: asyncio.Queue[list[Any] | Exception | None],
+        since_id_int: int | None = None,
+    ) -> None:
+        """
+        Fetch bookmark pages ahead of the consumer in get_bookmarks.
+
+        Each page's tweets are put on the queue, followed by None once pagination
+        ends, or by the exception that stopped it.
+
+        Args:
+            client: Connected twikit client
+            max_results: Maximum number of bookmarks to fetch per page
+            pages: Bounded queue shared with get_bookmarks
+            since_id_int: Stop after the page containing a tweet at or below this ID
+        """
+        cursor = None
+
+        try:
             while True:
                 # Fetch a page of bookmarks with retry logic
                 try:
                     bookmarks_response = await self._retry_with_backoff(
-                        self.client.get_bookmarks,
+                        client.get_bookmarks,
                         count=max_results,
                         cursor=cursor,
                     )
@@ -186,22 +314,18 @@ class TwitterClient:
                     logger.info("No more bookmarks to fetch")
                     break
 
-                # Process tweets from the response
                 tweets = getattr(bookmarks_response, "tweets", []) or []
                 if not tweets:
                     logger.info("No tweets in response, ending pagination")
                     break
 
-                for tweet in tweets:
-                    # Skip if we've reached the since_id checkpoint
-                    if since_id and tweet.id <= since_id:
-                        logger.info(f"Reached checkpoint tweet {since_id}, stopping")
-                        return
+                await pages.put(tweets)
 
-                    # Convert tweet to TwitterBookmark
-                    bookmark = self._convert_tweet_to_bookmark(tweet)
-                    total_fetched += 1
-                    yield bookmark
+                # The consumer stops at the checkpoint, so don't fetch past it
+                if since_id_int is not None and any(
+                    int(tweet.id) <= since_id_int for tweet in tweets
+                ):
+                    break
 
                 # Check for next page cursor
                 cursor = getattr(bookmarks_response, "next_cursor", None)
@@ -209,17 +333,11 @@ class TwitterClient:
                     logger.info("No more pages available")
                     break
 
-                logger.info(f"Fetched {total_fetched} bookmarks so far, continuing to next page")
-
-            logger.info(f"Completed fetching bookmarks. Total: {total_fetched}")
-
-        except RateLimitError:
-            raise
-        except AuthenticationError:
-            raise
         except Exception as e:
-            logger.error(f"Unexpected error during bookmark fetching: {e}")
-            raise NetworkError(f"Bookmark fetching failed: {str(e)}") from e
+            await pages.put(e)
+            return
+
+        await pages.put(None)
 
     async def get_bookmark_count(self) -> int:
         """
@@ -229,16 +347,16 @@ class TwitterClient:
             Total number of bookmarks
 
         Raises:
+            NotConnectedError: If not connected
             AuthenticationError: If not authenticated
             NetworkError: If network errors occur
         """
-        if not self._authenticated or not self.client:
-            raise AuthenticationError("Client not authenticated. Call authenticate() first.")
+        client = self._require_client()
 
         try:
             # Fetch first page to get count
             bookmarks_response = await self._retry_with_backoff(
-                self.client.get_bookmarks,
+                client.get_bookmarks,
                 count=1,
             )
 
@@ -255,6 +373,23 @@ class TwitterClient:
             logger.error(f"Failed to get bookmark count: {e}")
             raise NetworkError(f"Failed to get bookmark count: {str(e)}") from e
 
+    async def convert_batch(self, tweets: list[Any]) -> list[TwitterBookmark]:
+        """
+        Convert a page of twikit tweets to TwitterBookmarks.
+
+        The conversion runs in a worker thread so the event loop keeps servicing
+        I/O (such as the next page being prefetched) while the page is converted.
+
+        Args:
+            tweets: Tweet objects from twikit
+
+        Returns:
+            TwitterBookmark objects in the same order
+        """
+        if not tweets:
+            return []
+        return await asyncio.to_thread(lambda: [self._convert_tweet_to_bookmark(t) for t in tweets])
+
     def _convert_tweet_to_bookmark(self, tweet: Any) -> TwitterBookmark:
         """
         Convert twikit tweet object to TwitterBookmark.
@@ -265,70 +400,14 @@ class TwitterClient:
         Returns:
             TwitterBookmark object
         """
-        # Extract media
-        media_list: list[TwitterMedia] = []
-        if hasattr(tweet, "media") and tweet.media:
-            for media_item in tweet.media:
-                media_type = getattr(media_item, "type", "photo")
-                media_url = getattr(media_item, "media_url_https", "") or getattr(
-                    media_item, "url", ""
-                )
-                thumbnail_url = getattr(media_item, "thumbnail_url", None)
-
-                if media_url:
-                    media_list.append(
-                        TwitterMedia(
-                            media_type=media_type,
-                            url=media_url,
-                            thumbnail_url=thumbnail_url,
-                        )
-                    )
-
-        # Extract author information
-        author = getattr(tweet, "user", None)
-        author_name = getattr(author, "name", "Unknown") if author else "Unknown"
-        author_username = getattr(author, "screen_name", "unknown") if author else "unknown"
-        author_profile_url = (
-            f"https://twitter.com/{author_username}" if author_username != "unknown" else ""
-        )
-
-        # Extract tweet text
-        text = getattr(tweet, "full_text", "") or getattr(tweet, "text", "")
-
-        # Extract created_at timestamp
-        created_at_str = getattr(tweet, "created_at", None)
-        if created_at_str:
-            # Parse Twitter's timestamp format
-            try:
-                created_at = datetime.strptime(created_at_str, "%a %b %d %H:%M:%S %z %Y")
-            except (ValueError, TypeError):
-                created_at = datetime.now()
-        else:
-            created_at = datetime.now()
-
-        # Build metadata
-        metadata = {
-            "retweet_count": getattr(tweet, "retweet_count", 0),
-            "favorite_count": getattr(tweet, "favorite_count", 0),
-            "reply_count": getattr(tweet, "reply_count", 0),
-            "lang": getattr(tweet, "lang", "en"),
-        }
-
-        return TwitterBookmark(
-            tweet_id=str(tweet.id),
-            tweet_url=f"https://twitter.com/{author_username}/status/{tweet.id}",
-            text=text,
-            author_name=author_name,
-            author_username=author_username,
-            author_profile_url=author_profile_url,
-            created_at=created_at,
-            media=media_list,
-            metadata=metadata,
-        )
+        return convert_tweet_to_bookmark(tweet, self._author_url_cache)
 
     async def _retry_with_backoff(self, func: Any, *args: Any, **kwargs: Any) -> Any:
         """
-        Execute function with exponential backoff retry logic.
+        Execute function with retry logic using decorrelated-jitter backoff.
+
+        Each delay is drawn uniformly between initial_backoff and three times the
+        previous delay (capped), so concurrent clients don't retry in lockstep.
 
         Args:
             func: Function to execute
@@ -343,6 +422,9 @@ class TwitterClient:
             NetworkError: If all retries are exhausted
         """
         last_exception: Exception | None = None
+        backoff_time = self.initial_backoff
+        is_coroutine = inspect.iscoroutinefunction(func)
+        errors = _twikit_errors()
 
         for attempt in range(self.max_retries):
             try:
@@ -350,30 +432,32 @@ class TwitterClient:
                 result = func(*args, **kwargs)
 
                 # Handle async functions
-                if asyncio.iscoroutine(result):
+                if is_coroutine:
                     result = await result
 
                 return result
 
-            except TooManyRequests as e:
+            except errors.TooManyRequests as e:
                 # Rate limit errors should not be retried
                 retry_after = 900  # Default to 15 minutes
                 error_msg = f"Rate limit exceeded. Retry after {retry_after} seconds"
                 logger.warning(error_msg)
                 raise RateLimitError(error_msg, retry_after_seconds=retry_after) from e
 
-            except (Unauthorized, Forbidden) as e:
+            except (errors.Unauthorized, errors.Forbidden) as e:
                 # Authentication errors should not be retried
                 raise AuthenticationError(f"Authentication error: {str(e)}") from e
 
-            except (BadRequest, NotFound) as e:
+            except (errors.BadRequest, errors.NotFound) as e:
                 # Client errors should not be retried
                 raise TwitterClientError(f"Client error: {str(e)}") from e
 
-            except (ServerError, ConnectionError, TimeoutError, OSError) as e:
+            except (errors.ServerError, ConnectionError, TimeoutError, OSError) as e:
                 # Network/server errors can be retried
                 last_exception = e
-                backoff_time = self.initial_backoff * (2**attempt)
+                backoff_time = random.uniform(
+                    self.initial_backoff, min(_MAX_BACKOFF_SECONDS, backoff_time * 3)
+                )
 
                 if attempt < self.max_retries - 1:
                     logger.warning(
@@ -389,7 +473,9 @@ class TwitterClient:
             except Exception as e:
                 # Unknown errors - retry with caution
                 last_exception = e
-                backoff_time = self.initial_backoff * (2**attempt)
+                backoff_time = random.uniform(
+                    self.initial_backoff, min(_MAX_BACKOFF_SECONDS, backoff_time * 3)
+                )
 
                 if attempt < self.max_retries - 1:
                     logger.warning(
@@ -0,0 +1,187 @@
+"""Conversion of twikit tweets into TwitterBookmark objects.
+
+This module is the per-tweet hot path of a bookmark sync. It is kept free of
+I/O and fully annotated so it can be compiled ahead of time with mypyc
+(``mypyc src/twitter/convert.py``); the pure-Python module is used otherwise.
+"""
+
+import operator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta, timezone
+from typing import Any
+
+_TWITTER_TIMESTAMP_FORMAT = "%a %b %d %H:%M:%S %z %Y"
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+_MEDIA_FIELDS = operator.attrgetter("type", "media_url_https", "url", "thumbnail_url")
+
+
+def _parse_twitter_timestamp(value: str) -> datetime:
+    """
+    Parse Twitter's fixed-width timestamp, e.g. "Wed Oct 10 20:19:24 +0000 2018".
+
+    Slices the known field offsets directly and only falls back to strptime
+    when the input does not have the expected shape.
+
+    Args:
+        value: Timestamp string from the Twitter API
+
+    Returns:
+        Timezone-aware datetime
+
+    Raises:
+        ValueError: If the value cannot be parsed
+    """
+    if len(value) != 30 or value[20] not in "+-":
+        return datetime.strptime(value, _TWITTER_TIMESTAMP_FORMAT)
+
+    try:
+        offset = value[20:25]
+        if offset == "+0000":
+            tz = UTC
+        else:
+            minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+            tz = timezone(timedelta(minutes=-minutes if offset[0] == "-" else minutes))
+        return datetime(
+            int(value[26:30]),
+            _MONTHS[value[4:7]],
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            tzinfo=tz,
+        )
+    except (KeyError, ValueError):
+        return datetime.strptime(value, _TWITTER_TIMESTAMP_FORMAT)
+
+
+@dataclass(slots=True, frozen=True)
+class TwitterMedia:
+    """Represents media attached to a tweet."""
+
+    media_type: str  # 'photo', 'video', 'animated_gif'
+    url: str
+    thumbnail_url: str | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class TwitterBookmark:
+    """Represents a Twitter bookmark."""
+
+    tweet_id: str
+    tweet_url: str
+    text: str
+    author_name: str
+    author_username: str
+    author_profile_url: str
+    created_at: datetime
+    media: list[TwitterMedia]
+    metadata: dict[str, Any]
+
+
+def _media_fields(media_item: Any) -> tuple[Any, Any, Any, Any]:
+    """
+    Read the attributes used from a twikit media item in one call.
+
+    Args:
+        media_item: Media object from twikit
+
+    Returns:
+        Tuple of (type, media_url_https, url, thumbnail_url)
+    """
+    try:
+        return _MEDIA_FIELDS(media_item)
+    except AttributeError:
+        # Some media types lack one of the fields; fall back to per-field defaults
+        return (
+            getattr(media_item, "type", "photo"),
+            getattr(media_item, "media_url_https", ""),
+            getattr(media_item, "url", ""),
+            getattr(media_item, "thumbnail_url", None),
+        )
+
+
+def convert_tweet_to_bookmark(
+    tweet: Any, author_urls: dict[str, str] | None = None
+) -> TwitterBookmark:
+    """
+    Convert twikit tweet object to TwitterBookmark.
+
+    Args:
+        tweet: Tweet object from twikit
+        author_urls: Optional cache of username -> profile URL prefix, shared
+            across tweets so the prefix is only formatted once per author
+
+    Returns:
+        TwitterBookmark object
+    """
+    # Extract media
+    media_list: list[TwitterMedia] = []
+    media = getattr(tweet, "media", None)
+    if media:
+        make_media = TwitterMedia
+        for media_item in media:
+            media_type, media_url_https, url, thumbnail_url = _media_fields(media_item)
+            media_url = media_url_https or url
+
+            if media_url:
+                media_list.append(make_media(media_type, media_url, thumbnail_url))
+
+    # Extract author information
+    author = getattr(tweet, "user", None)
+    author_name = getattr(author, "name", "Unknown") if author else "Unknown"
+    author_username = getattr(author, "screen_name", "unknown") if author else "unknown"
+    if author_urls is None:
+        author_url = f"https://twitter.com/{author_username}"
+    else:
+        author_url = author_urls.get(author_username) or author_urls.setdefault(
+            author_username, f"https://twitter.com/{author_username}"
+        )
+    author_profile_url = author_url if author_username != "unknown" else ""
+
+    # Extract tweet text
+    text = getattr(tweet, "full_text", "") or getattr(tweet, "text", "")
+
+    # Extract created_at timestamp
+    created_at_str = getattr(tweet, "created_at", None)
+    if created_at_str:
+        # Parse Twitter's timestamp format
+        try:
+            created_at = _parse_twitter_timestamp(created_at_str)
+        except (ValueError, TypeError):
+            created_at = datetime.now()
+    else:
+        created_at = datetime.now()
+
+    # Build metadata
+    metadata = {
+        "retweet_count": getattr(tweet, "retweet_count", 0),
+        "favorite_count": getattr(tweet, "favorite_count", 0),
+        "reply_count": getattr(tweet, "reply_count", 0),
+        "lang": getattr(tweet, "lang", "en"),
+    }
+
+    tweet_id = str(tweet.id)
+    return TwitterBookmark(
+        tweet_id=tweet_id,
+        tweet_url=f"{author_url}/status/{tweet_id}",
+        text=text,
+        author_name=author_name,
+        author_username=author_username,
+        author_profile_url=author_profile_url,
+        created_at=created_at,
+        media=media_list,
+        metadata=metadata,
+    )